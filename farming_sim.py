@@ -18,14 +18,22 @@ New features
 • Rabbits are indestructible; plan your timing wisely.
 """
 
-import math
 import random
 import sys
-import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
 import pygame
+from pygame._sdl2.video import Image, Renderer, Texture, Window
+
+try:
+    from numba import njit
+except ImportError:             # Numba is optional — kernels run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
 
 # ──────────────────────────────── CONSTANTS ──────────────────────────────── #
 TILE              = 64
@@ -35,6 +43,15 @@ SIDEBAR_W         = 220         # widened a little for breathing room
 WIN_W, WIN_H      = FIELD_W + SIDEBAR_W, FIELD_H
 FPS               = 60
 RABBIT_MOVE_INT   = 0.6         # seconds between rabbit hops
+RABBIT_CAP        = 128         # max rabbits alive at once
+DIR_POOL_SIZE     = 4096        # pre‑drawn random hop directions
+ALPHA_STEPS       = 16          # pre‑faded copies per pulsing surface
+FLASH_TIME        = 0.3         # seconds a freshly planted tile flashes
+
+# Ripe‑crop pulse: alpha = 128 + 127·sin(phase), sampled into 256 steps per turn
+SIN_LUT         = (np.sin(np.arange(256) * 2 * np.pi / 256) * 127 + 128).astype(np.uint8)
+PULSE_LUT_SCALE = 256 / (2 * np.pi)
+TILE_PHASE      = np.add.outer(np.arange(COLS), np.arange(ROWS))      # gx + gy per tile
 
 # Sidebar layout tweaks
 SEED_TITLE_PAD_Y  = 15       # padding from top for "Seeds" title
@@ -44,6 +61,7 @@ SEED_KEY_X_OFF    = 10       # x‑offsets within sidebar
 SEED_EMOJI_X_OFF  = 25
 SEED_COST_X_OFF   = 60
 LEGEND_EXTRA_PAD  = 12       # gap between last seed row and legend
+SIDEBAR_RECT      = pygame.Rect(FIELD_W, 0, SIDEBAR_W, WIN_H)
 
 # ──────────────────────────────── CROP DATA ──────────────────────────────── #
 @dataclass(frozen=True)
@@ -64,30 +82,65 @@ CROPS = [
     CropType("6", "Broccoli", ("🥦","🌱","🌿","🥦"), 300, 7, 18),
 ]
 CROP_BY_KEY = {c.key: c for c in CROPS}
-
-# ──────────────────────────────── TILE & RABBIT DATA ─────────────────────── #
-@dataclass
-class Tile:
-    crop      : CropType | None = None
-    planted_at: float  = 0.0
-    stage     : int    = 0
-    fertilized: bool   = False
-    flash_to  : float  = 0.0     # yellow‑flash timer
-    sparkle_t : float  = 0.0     # sparkle anim start
-
-@dataclass
-class Rabbit:
-    x: int
-    y: int
-    next_move: float = 0.0      # timestamp of next hop
+CROP_IDX    = {c: i for i, c in enumerate(CROPS)}
+GROW_TIME_LUT = np.array([c.grow_time for c in CROPS], dtype=np.float64)
+
+# ──────────────────────────────── RABBIT DATA ────────────────────────────── #
+DIRS = np.array([(0, -1), (0, 1), (-1, 0), (1, 0)], dtype=np.int16)   # hop directions
+
+# ──────────────────────────────── KERNELS ────────────────────────────────── #
+@njit(cache=True)
+def _step(crop_idx, planted_at, stage, fertilized, flash_to, sparkle_t,
+          active_x, active_y, n_active,
+          rabbit_x, rabbit_y, rabbit_next, n_rabbits, dir_pool, dir_cursor,
+          grow_time_lut, now):
+    """Advance crops and rabbits in place.
+
+    Only the first *n_active* tiles listed in active_x/active_y are still
+    growing; a tile is swap‑removed from that list once it ripens.
+    Hop directions are consumed from *dir_pool* starting at *dir_cursor*.
+    Returns (number of crops that just ripened, new n_active, new cursor).
+    """
+    cols, rows = crop_idx.shape
+    # Growth
+    ripened = 0
+    i = 0
+    while i < n_active:
+        gx, gy = active_x[i], active_y[i]
+        new_stage = min(int((now - planted_at[gx, gy]) / grow_time_lut[crop_idx[gx, gy]] * 4), 3)
+        stage[gx, gy] = new_stage
+        if new_stage == 3:
+            ripened += 1
+            n_active -= 1
+            active_x[i], active_y[i] = active_x[n_active], active_y[n_active]
+        else:
+            i += 1
+    # Rabbits hop when due, then munch any ripe crop they land on
+    for i in range(n_rabbits):
+        if now >= rabbit_next[i]:
+            d = dir_pool[dir_cursor]
+            dir_cursor += 1
+            rabbit_x[i] = (rabbit_x[i] + DIRS[d, 0]) % cols
+            rabbit_y[i] = (rabbit_y[i] + DIRS[d, 1]) % rows
+            rabbit_next[i] = now + RABBIT_MOVE_INT
+        x, y = rabbit_x[i], rabbit_y[i]
+        if crop_idx[x, y] >= 0 and stage[x, y] == 3:
+            crop_idx[x, y]   = -1
+            planted_at[x, y] = 0.0
+            stage[x, y]      = 0
+            fertilized[x, y] = False
+            flash_to[x, y]   = 0.0
+            sparkle_t[x, y]  = 0.0
+    return ripened, n_active, dir_cursor
 
 # ──────────────────────────────── GAME CLASS ──────────────────────────────── #
 class TinyTractorTycoon:
     def __init__(self):
         pygame.init()
-        self.screen  = pygame.display.set_mode((WIN_W, WIN_H))
-        pygame.display.set_caption("🚜 Tiny Tractor Tycoon — Rabbits Edition")
-        self.clock   = pygame.time.Clock()
+        # Hardware renderer: every sprite is uploaded once as a GPU texture
+        self.window   = Window("🚜 Tiny Tractor Tycoon — Rabbits Edition", size=(WIN_W, WIN_H))
+        self.renderer = Renderer(self.window)
+        self.clock    = pygame.time.Clock()
 
         # ─── Fonts ─────────────────── #
         emoji_font_name = next((f for f in pygame.font.get_fonts() if "emoji" in f), None)
@@ -99,40 +152,150 @@ class TinyTractorTycoon:
         self.sidebar_ui_font = pygame.font.SysFont(None, 16)
 
         # ─── Field state ───────────── #
-        self.grid = [[Tile() for _ in range(ROWS)] for _ in range(COLS)]
+        # One (COLS, ROWS) array per tile attribute; crop_idx == -1 is empty soil.
+        self.crop_idx   = np.full((COLS, ROWS), -1, dtype=np.int8)   # index into CROPS
+        self.planted_at = np.zeros((COLS, ROWS), dtype=np.float64)
+        self.stage      = np.zeros((COLS, ROWS), dtype=np.int8)
+        self.fertilized = np.zeros((COLS, ROWS), dtype=np.bool_)
+        self.flash_to   = np.zeros((COLS, ROWS), dtype=np.float64)   # yellow‑flash timer
+        self.sparkle_t  = np.zeros((COLS, ROWS), dtype=np.float64)   # sparkle anim start
+        # Coordinates of tiles still growing (planted, not yet stage 3)
+        self._active_x  = np.zeros(COLS * ROWS, dtype=np.int16)
+        self._active_y  = np.zeros(COLS * ROWS, dtype=np.int16)
+        self._n_active  = 0
 
         # ─── Player state ──────────── #
         self.x, self.y   = 0, 0          # tile coordinates
         self.selected    = CROPS[0]      # currently selected seed
         self.coins       = 25
-        self.harvest_log = {c: 0 for c in CROPS}
+        self.harvest_log = [0] * len(CROPS)   # indexed like CROPS
 
         # ─── Rabbits ────────────────── #
-        self.rabbits: list[Rabbit] = []
-
-        # ─── Pre‑render crop emoji surfaces ──────────── #
+        # Fixed‑capacity arrays; only the first n_rabbits entries are live.
+        self.rabbit_x    = np.zeros(RABBIT_CAP, dtype=np.int16)
+        self.rabbit_y    = np.zeros(RABBIT_CAP, dtype=np.int16)
+        self.rabbit_next = np.zeros(RABBIT_CAP, dtype=np.float64)   # timestamp of next hop
+        self.n_rabbits   = 0
+        # Hop directions are drawn in bulk and consumed by _step()
+        self._dir_pool   = np.random.randint(0, 4, DIR_POOL_SIZE).astype(np.int8)
+        self._dir_cursor = 0
+
+        # ─── Tile geometry (fixed, so computed once) ─── #
+        self.tile_rects = [[pygame.Rect(gx * TILE, gy * TILE, TILE, TILE) for gy in range(ROWS)]
+                           for gx in range(COLS)]
+        self.tile_center    = [[r.center for r in col] for col in self.tile_rects]
+        self.sparkle_center = [[(r.right - 12, r.top + 12) for r in col] for col in self.tile_rects]
+
+        # ─── Pre‑render static background (soil grid + sidebar panel) ── #
+        bg = pygame.Surface((WIN_W, WIN_H))
+        bg.fill((40, 120, 40))
+        for col in self.tile_rects:
+            for rect in col:
+                pygame.draw.rect(bg, (80, 50, 20), rect)
+                pygame.draw.rect(bg, (30, 30, 30), rect, 1)  # grid lines
+        pygame.draw.rect(bg, (50, 60, 70), SIDEBAR_RECT)
+        pygame.draw.rect(bg, (20, 20, 20), SIDEBAR_RECT, 2)
+        self.bg = self.texture(bg)
+
+        # ─── Pre‑render crop emoji textures ──────────── #
         self.crop_img = {
-            (c, s): self.emoji_font.render(c.emojis[s], True, (255, 255, 255))
+            (c, s): self.texture(self.emoji_font.render(c.emojis[s], True, (255, 255, 255)))
             for c in CROPS for s in range(3)
         }
-        # Stage‑3 will pulse alpha, so keep text surface without alpha preset:
-        self.crop_img_stage3 = {c: self.emoji_font.render(c.emojis[3], True, (255, 255, 255)) for c in CROPS}
-        # Sparkle surface
-        self.sparkle = self.emoji_font.render("✨", True, (255, 255, 255))
+        # Stage‑3 pulses alpha: one shared texture per crop, one Image per alpha bucket
+        self.crop_img_stage3_alpha = {}
+        for c in CROPS:
+            tex = self.texture(self.emoji_font.render(c.emojis[3], True, (255, 255, 255)))
+            for k in range(ALPHA_STEPS):
+                self.crop_img_stage3_alpha[(c, k)] = self.faded(tex, k)
+        # Planting flash, one yellow square faded per alpha bucket
+        flash = pygame.Surface((TILE, TILE))
+        flash.fill((255, 255, 0))
+        flash_tex = self.texture(flash)
+        flash_tex.blend_mode = pygame.BLENDMODE_BLEND
+        self.flash_imgs = [self.faded(flash_tex, k) for k in range(ALPHA_STEPS)]
+        # Sparkle texture
+        self.sparkle = self.texture(self.emoji_font.render("✨", True, (255, 255, 255)))
         # Tractor
-        self.tractor_img = self.emoji_font.render("🚜", True, (255, 255, 255))
+        self.tractor_img = self.texture(self.emoji_font.render("🚜", True, (255, 255, 255)))
         # Rabbit
-        self.rabbit_img  = self.emoji_font.render("🐇", True, (255, 255, 255))
+        self.rabbit_img  = self.texture(self.emoji_font.render("🐇", True, (255, 255, 255)))
+
+        # ─── Sidebar text ───────────── #
+        # Static labels are rendered once; dynamic counters go through
+        # cached_text() and are only re‑rendered when their value changes.
+        self.seed_title    = self.texture(self.sidebar_ui_font.render("Seeds", True, (255, 255, 255)))
+        self.harvest_title = self.texture(self.sidebar_ui_font.render("Harvested", True, (255, 255, 255)))
+        self.seed_row_texs = {}
+        for c in CROPS:
+            for sel in (False, True):
+                self.seed_row_texs[(c, sel)] = (
+                    self.texture(self.sidebar_ui_font.render(c.key, True, (30, 30, 30) if sel else (200, 200, 200))),
+                    self.texture(self.sidebar_emoji_font.render(c.emojis[3], True, (30, 30, 30) if sel else (255, 255, 255))),
+                    self.texture(self.small_font.render(f"{c.seed_cost} 💰", True, (30, 30, 30) if sel else (180, 180, 180))),
+                )
+        self.harvest_emoji_texs = [self.texture(self.sidebar_emoji_font.render(c.emojis[3], True, (255, 255, 255)))
+                                    for c in CROPS]
+        legend_lines = ["WASD/Arrows: move",
+                        "SPACE: plant/harvest",
+                        "1‑6: pick seed",
+                        "F: fertilizer (5💰)",
+                        "ESC: quit"]
+        self.legend_texs = [self.texture(self.small_font.render(line, True, (180, 180, 180))) for line in legend_lines]
+        self._text_cache = {}
+        # Selection highlight (rounded corners, so pre‑drawn rather than a renderer rect)
+        highlight = pygame.Surface((SIDEBAR_W - 8, SEED_ROW_H - 4), pygame.SRCALPHA)
+        pygame.draw.rect(highlight, (220, 220, 70), highlight.get_rect(), 0, border_radius=4)
+        pygame.draw.rect(highlight, (50, 50, 20), highlight.get_rect(), 2, border_radius=4)
+        self.highlight = self.texture(highlight)
+
+        # ─── Key bindings ───────────── #
+        self._key_actions = {
+            pygame.K_ESCAPE: lambda now: pygame.event.post(pygame.event.Event(pygame.QUIT)),
+            pygame.K_w:      lambda now: self.move(0, -1),
+            pygame.K_UP:     lambda now: self.move(0, -1),
+            pygame.K_s:      lambda now: self.move(0, 1),
+            pygame.K_DOWN:   lambda now: self.move(0, 1),
+            pygame.K_a:      lambda now: self.move(-1, 0),
+            pygame.K_LEFT:   lambda now: self.move(-1, 0),
+            pygame.K_d:      lambda now: self.move(1, 0),
+            pygame.K_RIGHT:  lambda now: self.move(1, 0),
+            pygame.K_SPACE:  self.handle_action,
+            pygame.K_f:      self.handle_fertilizer,
+        }
+        self._seed_keys = {pygame.key.key_code(k): c for k, c in CROP_BY_KEY.items()}
+
+    # ─────────────────────────────────────────────────────────────────── #
+    def texture(self, surf):
+        """Upload a surface to the GPU once."""
+        return Texture.from_surface(self.renderer, surf)
+
+    # ─────────────────────────────────────────────────────────────────── #
+    @staticmethod
+    def faded(tex, k):
+        """An Image of *tex* drawn at the centre alpha of bucket *k*."""
+        img = Image(tex)
+        img.alpha = int((k + 0.5) * 256 / ALPHA_STEPS)
+        return img
+
+    # ─────────────────────────────────────────────────────────────────── #
+    def cached_text(self, slot, font, text, color):
+        """Return a rendered text texture, re‑rendering only if *text* changed."""
+        cached = self._text_cache.get(slot)
+        if cached is None or cached[0] != text:
+            cached = (text, self.texture(font.render(text, True, color)))
+            self._text_cache[slot] = cached
+        return cached[1]
 
     # ─────────────────────────────────────────────────────────────────── #
     def run(self):
+        tick, handle_input, update, render = self.clock.tick, self.handle_input, self.update, self.render
         while True:
-            dt  = self.clock.tick(FPS) / 1000.0
-            now = time.time()
-            self.handle_input(now)
-            self.update_growth(now)
-            self.update_rabbits(now)
-            self.render(now)
+            tick(FPS)
+            now = pygame.time.get_ticks() * 0.001     # seconds since pygame.init()
+            handle_input(now)
+            update(now)
+            render(now)
 
     # ─────────────────────────────────────────────────────────────────── #
     def handle_input(self, now):
@@ -140,208 +303,203 @@ class TinyTractorTycoon:
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             if event.type == pygame.KEYDOWN:
-                match event.key:
-                    case pygame.K_ESCAPE: pygame.event.post(pygame.event.Event(pygame.QUIT))
-                    case pygame.K_w | pygame.K_UP: self.y = (self.y - 1) % ROWS
-                    case pygame.K_s | pygame.K_DOWN: self.y = (self.y + 1) % ROWS
-                    case pygame.K_a | pygame.K_LEFT: self.x = (self.x - 1) % COLS
-                    case pygame.K_d | pygame.K_RIGHT: self.x = (self.x + 1) % COLS
-                    case pygame.K_SPACE: self.handle_action(now)
-                    case pygame.K_f: self.handle_fertilizer(now)
-                    case _:
-                        key = pygame.key.name(event.key)
-                        if key in CROP_BY_KEY:
-                            self.selected = CROP_BY_KEY[key]
+                action = self._key_actions.get(event.key)
+                if action:
+                    action(now)
+                elif event.key in self._seed_keys:
+                    self.selected = self._seed_keys[event.key]
+
+    # ─────────────────────────────────────────────────────────────────── #
+    def move(self, dx, dy):
+        self.x = (self.x + dx) % COLS
+        self.y = (self.y + dy) % ROWS
 
     # ─────────────────────────────────────────────────────────────────── #
     def handle_action(self, now):
-        tile = self.grid[self.x][self.y]
-        if tile.crop is None:
+        x, y = self.x, self.y
+        if self.crop_idx[x, y] < 0:
             # Plant seed
             c = self.selected
             if self.coins >= c.seed_cost:
                 self.coins -= c.seed_cost
-                tile.crop       = c
-                tile.planted_at = now
-                tile.stage      = 0
-                tile.fertilized = False
-                tile.flash_to   = now + 0.3
-        elif tile.stage == 3:
+                self.crop_idx[x, y]   = CROP_IDX[c]
+                self.planted_at[x, y] = now
+                self.stage[x, y]      = 0
+                self.fertilized[x, y] = False
+                self.flash_to[x, y]   = now + FLASH_TIME
+                self._active_x[self._n_active] = x
+                self._active_y[self._n_active] = y
+                self._n_active += 1
+        elif self.stage[x, y] == 3:
             # Harvest
-            self.coins += tile.crop.reward
-            self.harvest_log[tile.crop] += 1
-            self.grid[self.x][self.y] = Tile()   # reset tile
+            ci = self.crop_idx[x, y]
+            self.coins += CROPS[ci].reward
+            self.harvest_log[ci] += 1
+            self.clear_tile(x, y)
 
     # ─────────────────────────────────────────────────────────────────── #
     def handle_fertilizer(self, now):
         if self.coins < 5:
             return
-        tile = self.grid[self.x][self.y]
-        if tile.crop and not tile.fertilized:
+        x, y = self.x, self.y
+        if self.crop_idx[x, y] >= 0 and not self.fertilized[x, y]:
             self.coins -= 5
-            elapsed = now - tile.planted_at
-            remaining = max(tile.crop.grow_time - elapsed, 0)
-            tile.planted_at -= remaining / 2    # halve remaining time
-            tile.fertilized  = True
-            tile.sparkle_t   = now
+            elapsed = now - self.planted_at[x, y]
+            remaining = max(GROW_TIME_LUT[self.crop_idx[x, y]] - elapsed, 0)
+            self.planted_at[x, y] -= remaining / 2    # halve remaining time
+            self.fertilized[x, y]  = True
+            self.sparkle_t[x, y]   = now
 
     # ─────────────────────────────────────────────────────────────────── #
-    def update_growth(self, now):
-        for gx in range(COLS):
-            for gy in range(ROWS):
-                tile = self.grid[gx][gy]
-                if tile.crop is None or tile.stage == 3:
-                    continue
-                elapsed = now - tile.planted_at
-                new_stage = min(int((elapsed / tile.crop.grow_time) * 4), 3)
-                if new_stage != tile.stage:
-                    # Crop just advanced a stage
-                    if new_stage == 3:
-                        self.spawn_rabbit()
-                    tile.stage = new_stage
+    def clear_tile(self, gx, gy):
+        """Reset a tile back to empty soil."""
+        self.crop_idx[gx, gy]   = -1
+        self.planted_at[gx, gy] = 0.0
+        self.stage[gx, gy]      = 0
+        self.fertilized[gx, gy] = False
+        self.flash_to[gx, gy]   = 0.0
+        self.sparkle_t[gx, gy]  = 0.0
+
+    # ─────────────────────────────────────────────────────────────────── #
+    def update(self, now):
+        if self._n_active == 0 and self.n_rabbits == 0:
+            return                      # nothing growing, nothing hopping
+        # Each rabbit hops at most once per step, so this guarantees enough directions
+        if self._dir_cursor + self.n_rabbits > DIR_POOL_SIZE:
+            self._dir_pool   = np.random.randint(0, 4, DIR_POOL_SIZE).astype(np.int8)
+            self._dir_cursor = 0
+        ripened, self._n_active, self._dir_cursor = _step(
+            self.crop_idx, self.planted_at, self.stage,
+            self.fertilized, self.flash_to, self.sparkle_t,
+            self._active_x, self._active_y, self._n_active,
+            self.rabbit_x, self.rabbit_y, self.rabbit_next, self.n_rabbits,
+            self._dir_pool, self._dir_cursor, GROW_TIME_LUT, now)
+        # Every crop that just reached stage 3 spawns a rabbit
+        for _ in range(ripened):
+            self.spawn_rabbit(now)
 
     # ─────────────────────────────────────────────────────────────────── #
-    def spawn_rabbit(self):
+    def spawn_rabbit(self, now):
         """Spawn a rabbit at a random tile (avoiding player tile)."""
+        if self.n_rabbits >= RABBIT_CAP:
+            return
         for _ in range(30):  # try a few times to avoid overcrowding one spot
             rx = random.randrange(COLS)
             ry = random.randrange(ROWS)
             if (rx, ry) != (self.x, self.y):
                 break
-        self.rabbits.append(Rabbit(rx, ry, time.time() + random.random() * RABBIT_MOVE_INT))
-
-    # ─────────────────────────────────────────────────────────────────── #
-    def update_rabbits(self, now):
-        for rabbit in self.rabbits:
-            # Move occasionally
-            if now >= rabbit.next_move:
-                dx, dy = random.choice([(0, -1), (0, 1), (-1, 0), (1, 0)])
-                rabbit.x = (rabbit.x + dx) % COLS
-                rabbit.y = (rabbit.y + dy) % ROWS
-                rabbit.next_move = now + RABBIT_MOVE_INT
-            # Check for munching
-            tile = self.grid[rabbit.x][rabbit.y]
-            if tile.crop and tile.stage == 3:
-                # Rabbit eats the crop — tile reset, player loses it
-                self.grid[rabbit.x][rabbit.y] = Tile()
+        i = self.n_rabbits
+        self.rabbit_x[i], self.rabbit_y[i] = rx, ry
+        self.rabbit_next[i] = now + random.random() * RABBIT_MOVE_INT
+        self.n_rabbits += 1
 
     # ─────────────────────────────────────────────────────────────────── #
     def render(self, now):
-        self.screen.fill((40, 120, 40))                  # background
-
         # ─── Draw field tiles ───────────────────────────── #
+        # Pull the tile arrays into plain lists once; per‑element numpy
+        # indexing is much slower than list indexing in this Python loop.
+        crop_idx   = self.crop_idx.tolist()
+        stage      = self.stage.tolist()
+        flash_to   = self.flash_to.tolist()
+        # Sparkles blink on the even eighth‑seconds since fertilizing
+        blink      = ((now - self.sparkle_t) * 8).astype(np.int32) & 1
+        sparkle_on = (self.fertilized & (blink == 0)).tolist()
+        # Alpha bucket of every tile's ripe pulse in one LUT lookup
+        phase      = ((now * 4 + TILE_PHASE) * PULSE_LUT_SCALE).astype(np.int64) & 255
+        pulse_k    = (SIN_LUT[phase] // (256 // ALPHA_STEPS)).tolist()
+        # Everything on the field is queued here and drawn in order below.
+        # Hot lookups are bound to locals so the tile loop avoids attribute access.
+        draws = []
+        push = draws.append
+        crop_img, crop_img_ripe = self.crop_img, self.crop_img_stage3_alpha
+        flash_imgs, sparkle = self.flash_imgs, self.sparkle
         for gx in range(COLS):
+            col_crop, col_stage  = crop_idx[gx], stage[gx]
+            col_flash, col_spark = flash_to[gx], sparkle_on[gx]
+            col_pulse = pulse_k[gx]
+            centers, rects, spark_centers = self.tile_center[gx], self.tile_rects[gx], self.sparkle_center[gx]
             for gy in range(ROWS):
-                left, top = gx * TILE, gy * TILE
-                rect = pygame.Rect(left, top, TILE, TILE)
-                pygame.draw.rect(self.screen, (80, 50, 20), rect)
-                pygame.draw.rect(self.screen, (30, 30, 30), rect, 1)  # grid lines
-
-                tile = self.grid[gx][gy]
-                if tile.crop:
-                    # choose surface
-                    if tile.stage == 3:
-                        base = self.crop_img_stage3[tile.crop]
-                        alpha = int(128 + 127 * math.sin(now * 4 + gx + gy))
-                        img = base.copy()
-                        img.set_alpha(alpha)
+                ci = col_crop[gy]
+                if ci >= 0:
+                    # choose texture
+                    crop = CROPS[ci]
+                    if col_stage[gy] == 3:
+                        img = crop_img_ripe[(crop, col_pulse[gy])]
                     else:
-                        img = self.crop_img[(tile.crop, tile.stage)]
+                        img = crop_img[(crop, col_stage[gy])]
 
-                    img_rect = img.get_rect(center=rect.center)
-                    self.screen.blit(img, img_rect)
+                    push((img, img.get_rect(center=centers[gy])))
 
                 # flash on planting
-                if tile.flash_to > now:
-                    flash_alpha = int(255 * (tile.flash_to - now) / 0.3)
-                    flash_surf = pygame.Surface((TILE, TILE), pygame.SRCALPHA)
-                    flash_surf.fill((255, 255, 0, flash_alpha))
-                    self.screen.blit(flash_surf, (left, top))
+                if col_flash[gy] > now:
+                    k = min(ALPHA_STEPS - 1, int(ALPHA_STEPS * (col_flash[gy] - now) / FLASH_TIME))
+                    push((flash_imgs[k], rects[gy]))
 
                 # sparkle if fertilized
-                if tile.fertilized:
-                    sparkle_phase = (now - tile.sparkle_t) * 4
-                    if sparkle_phase % 1 < 0.5:        # blink
-                        spark_rect = self.sparkle.get_rect(center=(left + TILE - 12, top + 12))
-                        self.screen.blit(self.sparkle, spark_rect)
+                if col_spark[gy]:
+                    push((sparkle, sparkle.get_rect(center=spark_centers[gy])))
 
         # ─── Draw rabbits ──────────────────────────────── #
-        for rabbit in self.rabbits:
-            r_rect = self.rabbit_img.get_rect(center=(rabbit.x * TILE + TILE // 2,
-                                                      rabbit.y * TILE + TILE // 2))
-            self.screen.blit(self.rabbit_img, r_rect)
+        n = self.n_rabbits
+        for rx, ry in zip(self.rabbit_x[:n].tolist(), self.rabbit_y[:n].tolist()):
+            draws.append((self.rabbit_img, self.rabbit_img.get_rect(center=self.tile_center[rx][ry])))
 
         # ─── Draw tractor ─────────────────────────── #
-        tractor_rect = self.tractor_img.get_rect(center=(self.x * TILE + TILE // 2,
-                                                         self.y * TILE + TILE // 2))
-        self.screen.blit(self.tractor_img, tractor_rect)
+        draws.append((self.tractor_img, self.tractor_img.get_rect(center=self.tile_center[self.x][self.y])))
 
-        # ─── Sidebar  ─────────────────────────────── #
+        # ─── Present ──────────────────────────────── #
+        self.bg.draw()                                   # background
+        for img, rect in draws:
+            img.draw(dstrect=rect)
+        self.render_sidebar()
+        self.renderer.present()
+
+    # ─────────────────────────────────────────────────────────────────── #
+    def render_sidebar(self):
         sb_left = FIELD_W
-        pygame.draw.rect(self.screen, (50, 60, 70), (sb_left, 0, SIDEBAR_W, WIN_H))
-        pygame.draw.rect(self.screen, (20, 20, 20), (sb_left, 0, SIDEBAR_W, WIN_H), 2)
 
         # Current seed selection
-        seed_title = self.sidebar_ui_font.render("Seeds", True, (255, 255, 255))
-        self.screen.blit(seed_title, (sb_left + 10, SEED_TITLE_PAD_Y))
+        self.seed_title.draw(dstrect=(sb_left + 10, SEED_TITLE_PAD_Y))
 
         for i, c in enumerate(CROPS):
             row_y = SEED_START_Y + i * SEED_ROW_H
 
             # Selection highlight rectangle
             if c == self.selected:
-                highlight_rect = pygame.Rect(sb_left + 4, row_y - 4,
-                                             SIDEBAR_W - 8, SEED_ROW_H - 4)
-                pygame.draw.rect(self.screen, (220, 220, 70), highlight_rect, 0, border_radius=4)
-                pygame.draw.rect(self.screen, (50, 50, 20), highlight_rect, 2, border_radius=4)
+                self.highlight.draw(dstrect=(sb_left + 4, row_y - 4))
 
             # Row contents
-            key_surf = self.sidebar_ui_font.render(c.key, True, (30, 30, 30) if c == self.selected else (200, 200, 200))
-            emoji_surf = self.sidebar_emoji_font.render(c.emojis[3], True, (30, 30, 30) if c == self.selected else (255, 255, 255))
-            cost_surf = self.small_font.render(f"{c.seed_cost} 💰", True,
-                                               (30, 30, 30) if c == self.selected else (180, 180, 180))
-
-            self.screen.blit(key_surf, (sb_left + SEED_KEY_X_OFF, row_y))
-            self.screen.blit(emoji_surf, (sb_left + SEED_EMOJI_X_OFF, row_y - 2))
-            self.screen.blit(cost_surf, (sb_left + SEED_COST_X_OFF, row_y + 2))
+            key_tex, emoji_tex, cost_tex = self.seed_row_texs[(c, c == self.selected)]
+            key_tex.draw(dstrect=(sb_left + SEED_KEY_X_OFF, row_y))
+            emoji_tex.draw(dstrect=(sb_left + SEED_EMOJI_X_OFF, row_y - 2))
+            cost_tex.draw(dstrect=(sb_left + SEED_COST_X_OFF, row_y + 2))
 
         # Coin counter
-        coin_text = self.ui_font.render(f"Coins: {self.coins} 💰", True, (255, 255, 255))
-        self.screen.blit(coin_text, (sb_left + 10, SEED_START_Y + len(CROPS) * SEED_ROW_H))
+        coin_text = self.cached_text("coins", self.ui_font, f"Coins: {self.coins} 💰", (255, 255, 255))
+        coin_text.draw(dstrect=(sb_left + 10, SEED_START_Y + len(CROPS) * SEED_ROW_H))
 
         # Harvest totals
         harvest_title_y = SEED_START_Y + len(CROPS) * SEED_ROW_H + 30
-        h_title = self.sidebar_ui_font.render("Harvested", True, (255, 255, 255))
-        self.screen.blit(h_title, (sb_left + 10, harvest_title_y))
+        self.harvest_title.draw(dstrect=(sb_left + 10, harvest_title_y))
 
-        for i, c in enumerate(CROPS):
+        for i, harvested in enumerate(self.harvest_log):
             y = harvest_title_y + 30 + i * 20
             if y > WIN_H - 20:
                 break
-            self.screen.blit(self.sidebar_emoji_font.render(c.emojis[3], True, (255, 255, 255)),
-                             (sb_left + 10, y - 2))
-            count = self.small_font.render(f"x {self.harvest_log[c]}", True, (200, 200, 200))
-            self.screen.blit(count, (sb_left + 45, y))
+            self.harvest_emoji_texs[i].draw(dstrect=(sb_left + 10, y - 2))
+            count = self.cached_text(("harvest", i), self.small_font,
+                                     f"x {harvested}", (200, 200, 200))
+            count.draw(dstrect=(sb_left + 45, y))
 
         # Help legend – placed dynamically below seed list (or above bottom)
-        legend_lines = ["WASD/Arrows: move",
-                        "SPACE: plant/harvest",
-                        "1‑6: pick seed",
-                        "F: fertilizer (5💰)",
-                        "ESC: quit"]
-
         legend_start_y = SEED_START_Y + len(CROPS) * SEED_ROW_H + LEGEND_EXTRA_PAD
-        legend_height = len(legend_lines) * 20
+        legend_height = len(self.legend_texs) * 20
         # Ensure it doesn't overlap harvest totals or go off screen
         legend_start_y = min(legend_start_y,
                              harvest_title_y - legend_height - 10)
 
-        for i, line in enumerate(legend_lines):
-            t = self.small_font.render(line, True, (180, 180, 180))
-            self.screen.blit(t, (sb_left + 10, legend_start_y + i * 20))
-
-        # ─── Flip! ─────────────────────────────── #
-        pygame.display.flip()
+        for i, t in enumerate(self.legend_texs):
+            t.draw(dstrect=(sb_left + 10, legend_start_y + i * 20))
 
 # ────────────────────────────── MAIN ────────────────────────────── #
 if __name__ == "__main__":